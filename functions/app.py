@@ -2,7 +2,6 @@ from flask import Flask, jsonify, send_file
 from flask_cors import CORS
 import os
 import sys
-import pandas as pd
 
 # Add the directory containing the scraper to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -17,8 +16,8 @@ CORS(app)  # Enable CORS for all routes
 def scrape_tenders():
     try:
         # Initialize and run the scraper
-        scraper = TenderScraper()
-        tenders = scraper.scrape_tenders()
+        with TenderScraper() as scraper:
+            tenders = scraper.scrape_tenders()
         
         # Save to Excel if tenders are found
         if tenders:
@@ -31,30 +30,8 @@ def scrape_tenders():
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             excel_filename = os.path.join(output_dir, f'tenders_{timestamp}.xlsx')
             
-            # Create DataFrame
-            df = pd.DataFrame(tenders)
-            
-            # Define all columns to ensure they are included
-            all_columns = [
-                'Title', 'URL', 'New', 
-                'Tender Type', 'Bid Number', 'Department', 
-                'Bid Description', 'Place where goods, works or services are required',
-                'Opening Date', 'Closing Date', 'Modified Date', 'Date Published',
-                'Enquiries/Contact Person', 'Email', 'Tel',
-                'Briefing Session', 'Compulsory Briefing', 'Briefing Date', 
-                'Venue', 'Special Conditions', 'Description'
-            ]
-            
-            # Ensure all columns exist in the DataFrame
-            for col in all_columns:
-                if col not in df.columns:
-                    df[col] = ''
-            
-            # Reorder DataFrame to match specified column order
-            df = df[all_columns]
-            
-            # Save to Excel
-            df.to_excel(excel_filename, index=False)
+            # Save to Excel with every column present and in order
+            scraper.save_to_excel(tenders, excel_filename)
             
             # Return tenders and file path
             return jsonify({
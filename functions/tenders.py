@@ -1,58 +1,351 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+import xlsxwriter
 import time
 import random
 import re
+import os
+import json
+import tempfile
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+logger = logging.getLogger(__name__)
+
+# Output columns for saved tenders, important fields first
+COLUMNS = (
+    'Title',
+    'URL',
+    'New',
+    'Tender Type',
+    'Bid Number',
+    'Department',
+    'Bid Description',
+    'Place where goods, works or services are required',
+    'Opening Date',
+    'Closing Date',
+    'Modified Date',
+    'Date Published',
+    'Enquiries/Contact Person',
+    'Email',
+    'Tel',
+    'Briefing Session',
+    'Compulsory Briefing',
+    'Briefing Date',
+    'Venue',
+    'Special Conditions',
+    'Description'
+)
+
+# Compiled once at import - the extractors run for every tender page
+# Ordered searches, first hit wins. A pattern for "Request for Quotation:
+# RFQ NUMBER" is not needed - the bare RFQ NUMBER pattern already matches it.
+_BID_NUMBER_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'RFQ NUMBER\s*(\d+/\d+)',
+    r'Bid Number\s*[:]\s*([A-Z]{2,}/\d+/\d+/\d+)',
+    r'\b([A-Z]{2,}/\d+/\d+/\d+)\b',
+    r'\b([A-Z]{2,}/\d+/\d+)\b',
+    r'\b([A-Z]{2,}\d+/\d+)\b',
+    r'\b(\d+/\d+)\b'
+)]
+
+_TRAILING_COLON_RE = re.compile(r'[:]\s*$')
+
+# Date value patterns, most specific first
+_DATE_VALUE_PATTERNS = (
+    # Complete date with day name, date, and optional time
+    r"[a-z]{3,9}day,\s*\d{1,2}\s*[a-z]{3,9}\s*\d{4}(?:\s+\d{1,2}:\d{2}(?:\s*[ap]m)?)?",
+    # Date without day name
+    r"\d{1,2}\s*[a-z]{3,9}\s*\d{4}(?:\s+\d{1,2}:\d{2}(?:\s*[ap]m)?)?",
+    # Everything until the next line or field
+    r"[^\n]+?(?=\n|$)",
+    # Everything until a double space or newline
+    r"[^\n]+?(?=\s{2,}|\n|$)"
+)
+_DATE_PREFIXES = ("Opening Date", "Closing Date", "Modified Date", "Date Published")
+# The label is matched once per prefix, then the shared value patterns are
+# tried from where it ends
+_DATE_LABEL_RES = {
+    prefix: re.compile(rf"{re.escape(prefix)}\s*[:]\s*", re.IGNORECASE)
+    for prefix in _DATE_PREFIXES
+}
+_DATE_VALUE_RES = [re.compile(value, re.IGNORECASE) for value in _DATE_VALUE_PATTERNS]
+# How far past a date prefix extract_date looks for its value
+_DATE_WINDOW = 300
+_DATE_FALLBACK_RES = {
+    prefix: re.compile(rf"{re.escape(prefix)}\s*[:]\s*(\S.*?)(?=\s*\n|\s*$)", re.IGNORECASE | re.MULTILINE)
+    for prefix in _DATE_PREFIXES
+}
+_DATE_STOP_WORDS = ("Enquiries", "Email", "Tel", "Briefing", "Department", "Bid Description", "Opening Date", "Closing Date", "Modified Date")
+# One alternation per prefix finds the earliest following field in one pass
+_DATE_STOP_RES = {
+    prefix: re.compile('|'.join(re.escape(word) for word in _DATE_STOP_WORDS if word != prefix))
+    for prefix in _DATE_PREFIXES
+}
+
+_CONTACT_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:Enquiries|Contact Person)\s*[:]\s*([^0-9,]+?)(?=\s*(?:Tel|Email|$))",
+    r"(?:Enquiries|Contact Person)\s*[:]\s*([^,]+?)(?=\s*(?:@|Tel|Email|$))"
+)]
+_CONTACT_NUMBER_RE = re.compile(r'[\d\(\)\-\+]+')
+_CONTACT_EMAIL_RE = re.compile(r'@.*')
+
+_EMAIL_FIELD_RE = re.compile(r'Email\s*[:]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+_PHONE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:Tel|Phone)\s*[:]\s*((?:\+27|0)[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{4})',
+    r'(?:Tel|Phone)\s*[:]\s*(\d{3}[\s\-]?\d{3}[\s\-]?\d{4})',
+    r'(?:Tel|Phone)\s*[:]\s*(\d{10,})'
+)]
+_PHONE_SEPARATOR_RE = re.compile(r'[\s\-]')
+
+_DESC_RE = re.compile(r"Bid Description\s*[:]\s*(.*?)(?=\s*(?:Place where|Opening Date|Closing Date|$))", re.DOTALL | re.IGNORECASE)
+_DESC_SPLIT_RE = re.compile(r'\s*(?:Place where)')
+
+_LOCATION_RE = re.compile(r"Place where goods, works or services are required\s*[:]\s*(.*?)(?=\s*(?:Opening Date|Closing Date|$))", re.DOTALL | re.IGNORECASE)
+_LOCATION_SPLIT_RE = re.compile(r'\s*(?:Opening Date|Closing Date)')
+
+_VENUE_ONLY_RE = re.compile(r"Venue\s*[:]\s*(.*?)(?=\s*(?:Special Conditions|Date|Time|$))", re.DOTALL | re.IGNORECASE)
+_VENUE_ONLY_SPLIT_RE = re.compile(r'\s*(?:Special Conditions|Date|Time)')
+
+_TENDER_TYPES = (
+    "Request for Quotation",
+    "Request for Bid(Open-Tender)",
+    "Request for Bid(Limited-Tender)",
+    "Request for Proposal"
+)
+_TENDER_TYPE_RE = re.compile('|'.join(re.escape(tender_type) for tender_type in _TENDER_TYPES))
+_BRIEFING_DATE_RES = [re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"Date\s*[:]\s*([A-Za-z]+day,\s*\d{1,2}\s*[A-Za-z]+\s*\d{4}(?:\s*-?\s*\d{1,2}:\d{2}(?:[AP]M)?)?)",
+    r"Date\s*[:]\s*(\d{1,2}\s*[A-Za-z]+\s*\d{4}(?:\s*-?\s*\d{1,2}:\d{2}(?:[AP]M)?)?)",
+    r"Date\s*[:]\s*([^\n]+?)(?=\s*(?:Venue|$))"
+)]
+# Searched in the lowered text; the venue is one line without a colon,
+# followed by the special conditions or the end of the page
+_VENUE_RE = re.compile(r"venue\s*[:]\s*([^:\n]+?)(?=\s*(?:special conditions|$))")
+_CONDITIONS_RE = re.compile(r"Special Conditions\s*[:]\s*(.*)", re.DOTALL)
+
+_DATE_VALUE = '|'.join(_DATE_VALUE_PATTERNS)
+
+# One pattern per labelled field, each searched for on its own: every
+# pattern starts with its literal label, so the engine skips straight to the
+# label instead of trying the field patterns at every position. The patterns
+# are written in lower case and run over the lower-cased text, so the engine
+# compares plain characters instead of case-folding each one; values are
+# sliced from the original text by span. Each value is captured in a
+# "<key>_value" group inside a lookahead, so a long or empty value never
+# swallows the next label.
+_FIELD_PATTERNS = {
+    'rfq_number': r"rfq number(?=\s*(?P<rfq_number_value>\d+/\d+))",
+    'bid_number': r"bid number\s*[:](?=\s*(?P<bid_number_value>[a-z]{2,}/\d+/\d+/\d+))",
+    'description': r"(?s:bid description\s*[:](?=\s*(?P<description_value>.*?)(?=\s*(?:place where|opening date|closing date|$))))",
+    'location': r"(?s:place where goods, works or services are required\s*[:](?=\s*(?P<location_value>.*?)(?=\s*(?:opening date|closing date|$))))",
+    'opening_date': rf"opening date\s*[:](?=\s*(?P<opening_date_value>{_DATE_VALUE}))",
+    'closing_date': rf"closing date\s*[:](?=\s*(?P<closing_date_value>{_DATE_VALUE}))",
+    'modified_date': rf"modified date\s*[:](?=\s*(?P<modified_date_value>{_DATE_VALUE}))",
+    'date_published': rf"date published\s*[:](?=\s*(?P<date_published_value>{_DATE_VALUE}))",
+    'contact': r"(?:enquiries|contact person)\s*[:](?=\s*(?P<contact_value>[^0-9,]+?)(?=\s*(?:tel|email|$)))",
+    'email': r"email\s*[:](?=\s*(?P<email_value>[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z|]{2,}))",
+    'tel': r"(?:tel|phone)\s*[:](?=\s*(?P<tel_value>(?:\+27|0)[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{4}))",
+    'conditions': r"(?s:special conditions\s*[:](?=\s*(?P<conditions_value>.*)))",
+}
+_FIELD_RES = {key: re.compile(pattern) for key, pattern in _FIELD_PATTERNS.items()}
+
+
+def _has_classes(*classes):
+    """XPath predicate matching elements that carry every given class."""
+    return ' and '.join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')" for cls in classes
+    )
+
+
+# Listing pages only ever use the tender section, so nothing else is built.
+# The class is matched as a token: a plain 'bg-light' string only matches
+# sections whose class attribute is exactly that, not "bg-light py-3"
+_SECTION_STRAINER = SoupStrainer('section', class_=re.compile(r'(?:^|\s)bg-light(?:\s|$)'))
+
+# Detail pages are walked with lxml directly; these mirror the CSS
+# selectors used on the listing pages
+_DETAILS_SECTION_MARKER = b'bg-light'
+_DETAILS_SECTION_XPATH = etree.XPath(f"//section[{_has_classes('bg-light')}]")
+_DETAILS_TAB_XPATH = etree.XPath(f".//div[{_has_classes('tab-pane', 'fade', 'active', 'show')}]")
+_TITLE_XPATH = etree.XPath(".//h3")
+
+# Labels checked in individual <p> tags when the text block has no dates
+_P_DATE_LABELS = ("Opening Date", "Closing Date", "Modified Date")
+
+
+# A following field's label on the same line - an empty value puts the next
+# label first, and some pages run every field together on one line
+_NEXT_LABEL_RE = re.compile(
+    r"(?:^|\s)(?:Bid Description|Place where goods, works or services are required|Opening Date|Closing Date|"
+    r"Modified Date|Date Published|Enquiries|Contact Person|Email|Tel|Briefing Session|Compulsory Briefing|"
+    r"Date|Venue|Special Conditions)\s*[:]",
+    re.IGNORECASE
+)
+
+
+def _lower_in_place(text):
+    """Lower-case text without changing its length, so positions line up."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. U+0130) lower-case to two; leave those as they are
+    return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+def _after_label(text, label, lowered=None):
+    """Return the first line of the value after "label:", or None if absent.
+
+    The label is matched case-insensitively, as the regexes this replaced
+    were, by looking it up in lowered (the text from _lower_in_place, which
+    is computed here if not given). Whitespace around the colon, line breaks
+    included, is skipped - the page text puts most values on the line after
+    their label.
+    """
+    if lowered is None:
+        lowered = _lower_in_place(text)
+    label = label.lower()
+    start = lowered.find(label)
+    while start >= 0:
+        i = start + len(label)
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if text.startswith(':', i):
+            i += 1
+            while i < len(text) and text[i].isspace():
+                i += 1
+            end = text.find('\n', i)
+            return text[i:end] if end >= 0 else text[i:]
+        start = lowered.find(label, i)
+    return None
+
+
+def _iter_text(element):
+    """Yield the text nodes under an element, as BeautifulSoup's get_text does.
+
+    Comments and the contents of script and style elements are skipped.
+    """
+    if element.text and element.tag not in ('script', 'style'):
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in ('script', 'style'):
+            yield from _iter_text(child)
+        if child.tail:
+            yield child.tail
+
+
+class RateLimiter:
+    """Space request starts out across threads, with some jitter."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval * random.uniform(0.5, 1.5)
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class TenderScraper:
-    def __init__(self, base_url='https://easytenders.co.za/tenders'):
+    def __init__(self, base_url='https://easytenders.co.za/tenders', max_workers=8, request_interval=1.0,
+                 seen_urls_path=None):
         self.base_url = base_url
+        self.max_workers = max_workers
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
         }
-        self.tenders = []
 
-    def get_soup(self, url):
-        """Make a request to the URL and return a BeautifulSoup object."""
-        response = requests.get(url, headers=self.headers)
+        # Reuse keep-alive connections to the tender site across requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Be nice to the server - detail pages are fetched concurrently, but
+        # request starts are still spaced out
+        self.rate_limiter = RateLimiter(request_interval)
+
+        # Tender URLs scraped on earlier runs, skipped when seen_urls_path is set
+        self.seen_urls_path = seen_urls_path
+        self.seen_urls = set()
+        if seen_urls_path and os.path.exists(seen_urls_path):
+            with open(seen_urls_path) as f:
+                self.seen_urls = set(json.load(f))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def save_seen_urls(self):
+        """Write the seen tender URLs back to seen_urls_path, if one is set."""
+        if not self.seen_urls_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.seen_urls_path))
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.part', delete=False) as f:
+            json.dump(sorted(self.seen_urls), f)
+        os.replace(f.name, self.seen_urls_path)
+
+    def fetch(self, url):
+        """Make a request to the URL and return the response body as bytes."""
+        self.rate_limiter.wait()
+        response = self.session.get(url, timeout=30)
         response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        return response.content
+
+    def get_soup(self, url, parse_only=None):
+        """Make a request to the URL and return a BeautifulSoup object.
+
+        parse_only is an optional SoupStrainer limiting which parts of the
+        page are built into the tree.
+        """
+        return BeautifulSoup(self.fetch(url), 'lxml', parse_only=parse_only)
 
     def clean_value(self, value):
         """Clean a value by removing extra whitespace and newlines."""
         if not value:
             return ""
-        return " ".join(value.strip().split())
+        # split() with no arguments already drops leading/trailing whitespace
+        return " ".join(value.split())
 
-    def extract_department_only(self, text):
+    def extract_department_only(self, text, lowered=None):
         """Extract only the department name from text."""
-        # Look for department pattern - stop at next field (Bid Description)
-        dept_pattern = r"Department\s*[:]\s*([^\n]+?)(?=\s*(?:Bid Description|$))"
-        dept_match = re.search(dept_pattern, text, re.IGNORECASE)
-        if dept_match:
-            dept_text = dept_match.group(1).strip()
-            return self.clean_value(dept_text)
+        # Take the department line - stop at next field (Bid Description)
+        dept_text = _after_label(text, "Department", lowered)
+        if dept_text:
+            return self.clean_value(_NEXT_LABEL_RE.split(dept_text, 1)[0])
         return ""
 
     def extract_bid_number_only(self, text):
         """Extract only the bid number from text."""
         # Look for RFQ NUMBER or bid number patterns
-        patterns = [
-            r'RFQ NUMBER\s*(\d+/\d+)',
-            r'Request for Quotation\s*[:]\s*RFQ NUMBER\s*(\d+/\d+)',
-            r'Bid Number\s*[:]\s*([A-Z]{2,}/\d+/\d+/\d+)',
-            r'\b([A-Z]{2,}/\d+/\d+/\d+)\b',
-            r'\b([A-Z]{2,}/\d+/\d+)\b',
-            r'\b([A-Z]{2,}\d+/\d+)\b',
-            r'\b(\d+/\d+)\b'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _BID_NUMBER_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return ""
@@ -60,145 +353,140 @@ class TenderScraper:
     def extract_field_value(self, text, field_name):
         """Extract a specific field value from a text block."""
         # Make the pattern more specific to avoid capturing extra content
-        pattern = rf"{field_name}\s*[:]\s*(.*?)(?=\s*(?:[A-Z][a-z]+\s*[:])|\s*$)"
+        pattern = rf"{re.escape(field_name)}\s*[:]\s*(.*?)(?=\s*(?:[A-Z][a-z]+\s*[:])|\s*$)"
         match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
         if match:
             value = match.group(1).strip()
             # Remove any trailing colons or special characters
-            value = re.sub(r'[:]\s*$', '', value)
+            value = _TRAILING_COLON_RE.sub('', value)
             return self.clean_value(value)
         return ""
 
-    def extract_date(self, text, date_prefix):
-        """Extract a complete date with a specific prefix."""
-        # Debug print to see what text we're working with
-        if date_prefix in text:
-            print(f"Looking for {date_prefix} in text snippet: {text[text.find(date_prefix):text.find(date_prefix)+100]}")
-        
-        # First, try to find the date field and everything after it until the next field
-        text_from_prefix = text[text.find(date_prefix):] if date_prefix in text else ""
-        
-        # More comprehensive patterns to capture full date strings
-        patterns = [
-            # Pattern for complete date with day name, date, and optional time - most specific first
-            rf"{date_prefix}\s*[:]\s*([A-Za-z]{{3,9}}day,\s*\d{{1,2}}\s*[A-Za-z]{{3,9}}\s*\d{{4}}(?:\s+\d{{1,2}}:\d{{2}}(?:\s*[AP]M)?)?)",
-            # Pattern for date without day name
-            rf"{date_prefix}\s*[:]\s*(\d{{1,2}}\s*[A-Za-z]{{3,9}}\s*\d{{4}}(?:\s+\d{{1,2}}:\d{{2}}(?:\s*[AP]M)?)?)",
-            # Pattern to capture until next line or field
-            rf"{date_prefix}\s*[:]\s*([^\n]+?)(?=\n|$)",
-            # Most general pattern - capture everything until double space or newline
-            rf"{date_prefix}\s*[:]\s*(.+?)(?=\s{{2,}}|\n|$)"
-        ]
+    def extract_date(self, text, date_prefix, lowered=None):
+        """Extract a complete date with a specific prefix.
+
+        lowered is the text as returned by _lower_in_place, if the caller
+        already has it; the prefix is looked up there case-insensitively.
+        """
+        if lowered is None:
+            lowered = _lower_in_place(text)
+        prefix = date_prefix.lower()
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                date_text = match.group(1).strip()
-                
-                # Debug print
-                print(f"Found date for {date_prefix}: '{date_text}'")
-                
-                # Clean up but preserve the full date
-                date_text = " ".join(date_text.split())
-                
-                # Make sure we didn't capture another field
-                stop_words = ["Enquiries", "Email", "Tel", "Briefing", "Department", "Bid Description", "Opening Date", "Closing Date", "Modified Date"]
-                for stop_word in stop_words:
-                    if stop_word in date_text and stop_word != date_prefix:
-                        date_text = date_text.split(stop_word)[0].strip()
-                        break
-                
-                # Final check - if we only have a single character, something went wrong
-                if len(date_text) > 1:
-                    return date_text
+        # Only the text just after each occurrence of the prefix can hold
+        # its date, so the patterns run over that window, not the whole page
+        idx = lowered.find(prefix)
+        while idx >= 0:
+            window = text[idx:idx + _DATE_WINDOW]
+            
+            # More comprehensive patterns to capture full date strings
+            label_match = _DATE_LABEL_RES[date_prefix].match(window)
+            if label_match:
+                for pattern in _DATE_VALUE_RES:
+                    match = pattern.match(window, label_match.end())
+                    if match:
+                        date_text = self.clean_date(match.group(), date_prefix)
+                        
+                        # Final check - if we only have a single character, something went wrong
+                        if len(date_text) > 1:
+                            return date_text
+            
+            # If we still haven't found anything, try a simpler approach - cut
+            # at the next field too, or a date left empty by the cut above
+            # would come back here with that field attached
+            simple_match = _DATE_FALLBACK_RES[date_prefix].match(window)
+            if simple_match:
+                return self.clean_date(simple_match.group(1), date_prefix)
+            
+            idx = lowered.find(prefix, idx + len(prefix))
         
-        # If we still haven't found anything, try a simpler approach
-        simple_match = re.search(rf"{date_prefix}\s*[:]\s*(\S.*?)(?=\s*\n|\s*$)", text, re.MULTILINE)
-        if simple_match:
-            return simple_match.group(1).strip()
+        return ""
+
+    def clean_date(self, date_text, date_prefix):
+        """Normalise a captured date and cut off any following field."""
+        # Clean up but preserve the full date
+        date_text = " ".join(date_text.split())
         
+        # Make sure we didn't capture another field
+        stop_match = _DATE_STOP_RES[date_prefix].search(date_text)
+        if stop_match:
+            date_text = date_text[:stop_match.start()].strip()
+        return date_text
+
+    def clean_contact_person(self, name):
+        """Strip phone numbers and email parts from a captured contact name."""
+        name = _CONTACT_NUMBER_RE.sub('', name.strip())
+        name = _CONTACT_EMAIL_RE.sub('', name)
+        return self.clean_value(name)
+
+    def extract_yes_no(self, text, label, lowered=None):
+        """Extract a Yes/No field as "YES", "NO" or an empty string."""
+        value = (_after_label(text, label, lowered) or "")[:3].upper()
+        if value == "YES":
+            return "YES"
+        if value.startswith("NO"):
+            return "NO"
         return ""
 
     def extract_contact_person(self, text):
         """Extract only the contact person name."""
-        patterns = [
-            r"(?:Enquiries|Contact Person)\s*[:]\s*([^0-9,]+?)(?=\s*(?:Tel|Email|$))",
-            r"(?:Enquiries|Contact Person)\s*[:]\s*([^,]+?)(?=\s*(?:@|Tel|Email|$))"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        for pattern in _CONTACT_RES:
+            match = pattern.search(text)
             if match:
-                name = match.group(1).strip()
-                # Remove any phone numbers or email parts
-                name = re.sub(r'[\d\(\)\-\+]+', '', name)
-                name = re.sub(r'@.*', '', name)
-                return self.clean_value(name)
+                return self.clean_contact_person(match.group(1))
         return ""
     
 
     def extract_email_only(self, text):
         """Extract only the email address."""
         # First check if there's an explicit Email: field
-        email_field_pattern = r'Email\s*[:]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
-        email_field_match = re.search(email_field_pattern, text, re.IGNORECASE)
+        email_field_match = _EMAIL_FIELD_RE.search(text)
         if email_field_match:
             return email_field_match.group(1).lower()
         
         # If not, look for any email address in the text
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             return email_match.group(0).lower()
         return ""
 
     def extract_phone_only(self, text):
         """Extract only the phone number."""
-        phone_patterns = [
-            r'(?:Tel|Phone)\s*[:]\s*((?:\+27|0)[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{4})',
-            r'(?:Tel|Phone)\s*[:]\s*(\d{3}[\s\-]?\d{3}[\s\-]?\d{4})',
-            r'(?:Tel|Phone)\s*[:]\s*(\d{10,})'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PHONE_RES:
+            match = pattern.search(text)
             if match:
                 phone = match.group(1).strip()
                 # Normalize phone format
-                phone = re.sub(r'[\s\-]', '', phone)
+                phone = _PHONE_SEPARATOR_RE.sub('', phone)
                 return phone
         return ""
 
     def extract_description_only(self, text):
         """Extract only the bid description."""
-        desc_pattern = r"Bid Description\s*[:]\s*(.*?)(?=\s*(?:Place where|Opening Date|Closing Date|$))"
-        desc_match = re.search(desc_pattern, text, re.DOTALL | re.IGNORECASE)
+        desc_match = _DESC_RE.search(text)
         if desc_match:
             desc = desc_match.group(1).strip()
             # Remove any location info that might have been captured
-            desc = re.split(r'\s*(?:Place where)', desc)[0]
+            desc = _DESC_SPLIT_RE.split(desc)[0]
             return self.clean_value(desc)
         return ""
 
     def extract_location_only(self, text):
         """Extract only the location/place information."""
-        loc_pattern = r"Place where goods, works or services are required\s*[:]\s*(.*?)(?=\s*(?:Opening Date|Closing Date|$))"
-        loc_match = re.search(loc_pattern, text, re.DOTALL | re.IGNORECASE)
+        loc_match = _LOCATION_RE.search(text)
         if loc_match:
             location = loc_match.group(1).strip()
             # Remove any date info that might have been captured
-            location = re.split(r'\s*(?:Opening Date|Closing Date)', location)[0]
+            location = _LOCATION_SPLIT_RE.split(location)[0]
             return self.clean_value(location)
         return ""
 
     def extract_venue_only(self, text):
         """Extract only the venue information."""
-        venue_pattern = r"Venue\s*[:]\s*(.*?)(?=\s*(?:Special Conditions|Date|Time|$))"
-        venue_match = re.search(venue_pattern, text, re.DOTALL | re.IGNORECASE)
+        venue_match = _VENUE_ONLY_RE.search(text)
         if venue_match:
             venue = venue_match.group(1).strip()
             # Remove any conditions or date info
-            venue = re.split(r'\s*(?:Special Conditions|Date|Time)', venue)[0]
+            venue = _VENUE_ONLY_SPLIT_RE.split(venue)[0]
             return self.clean_value(venue)
         return ""
 
@@ -207,79 +495,100 @@ class TenderScraper:
         fields = {}
         
         # Extract the tender type (Request for Quotation, Request for Bid, etc.)
-        tender_types = [
-            "Request for Quotation", 
-            "Request for Bid(Open-Tender)", 
-            "Request for Bid(Limited-Tender)", 
-            "Request for Proposal"
-        ]
+        tender_type_match = _TENDER_TYPE_RE.search(text)
+        if tender_type_match:
+            fields["Tender Type"] = tender_type_match.group()
         
-        for tender_type in tender_types:
-            if tender_type in text:
-                fields["Tender Type"] = tender_type
-                break
+        # Collect the first value of every labelled field; the single-field
+        # extractors only run for fields that were not found
+        lowered = _lower_in_place(text)
+        found = {}
+        for key, pattern in _FIELD_RES.items():
+            match = pattern.search(lowered)
+            if match:
+                start, end = match.span(f"{key}_value")
+                found[key] = text[start:end]
+        
+        # Extract specific fields
+        if 'rfq_number' in found or 'bid_number' in found:
+            fields["Bid Number"] = found.get('rfq_number') or found['bid_number']
+        else:
+            fields["Bid Number"] = self.extract_bid_number_only(text)
         
-        # Extract specific fields using improved extraction methods
-        fields["Bid Number"] = self.extract_bid_number_only(text)
-        fields["Department"] = self.extract_department_only(text)
-        fields["Bid Description"] = self.extract_description_only(text)
-        fields["Place where goods, works or services are required"] = self.extract_location_only(text)
+        fields["Department"] = self.extract_department_only(text, lowered)
+        
+        if 'description' in found:
+            desc = _DESC_SPLIT_RE.split(found['description'].strip())[0]
+            fields["Bid Description"] = self.clean_value(desc)
+        else:
+            fields["Bid Description"] = self.extract_description_only(text)
+        
+        if 'location' in found:
+            location = _LOCATION_SPLIT_RE.split(found['location'].strip())[0]
+            fields["Place where goods, works or services are required"] = self.clean_value(location)
+        else:
+            fields["Place where goods, works or services are required"] = self.extract_location_only(text)
         
         # Extract dates
-        fields["Opening Date"] = self.extract_date(text, "Opening Date")
-        fields["Closing Date"] = self.extract_date(text, "Closing Date")
-        fields["Modified Date"] = self.extract_date(text, "Modified Date")
-        fields["Date Published"] = self.extract_date(text, "Date Published")
+        for key, date_prefix in (
+            ('opening_date', "Opening Date"),
+            ('closing_date', "Closing Date"),
+            ('modified_date', "Modified Date"),
+            ('date_published', "Date Published")
+        ):
+            date_text = self.clean_date(found[key], date_prefix) if key in found else ""
+            if len(date_text) <= 1:
+                date_text = self.extract_date(text, date_prefix, lowered)
+            fields[date_prefix] = date_text
         
         # Extract contact information
-        fields["Enquiries/Contact Person"] = self.extract_contact_person(text)
-        fields["Email"] = self.extract_email_only(text)
-        fields["Tel"] = self.extract_phone_only(text)
+        if 'contact' in found:
+            fields["Enquiries/Contact Person"] = self.clean_contact_person(found['contact'])
+        else:
+            fields["Enquiries/Contact Person"] = self.extract_contact_person(text)
+        
+        if 'email' in found:
+            fields["Email"] = found['email'].lower()
+        else:
+            fields["Email"] = self.extract_email_only(text)
+        
+        if 'tel' in found:
+            fields["Tel"] = _PHONE_SEPARATOR_RE.sub('', found['tel'].strip())
+        else:
+            fields["Tel"] = self.extract_phone_only(text)
         
         # Extract briefing session info
         # Check for "Briefing Session: Yes/No"
-        briefing_session_match = re.search(r"Briefing Session\s*[:]\s*(Yes|No)", text, re.IGNORECASE)
-        if briefing_session_match:
-            fields["Briefing Session"] = briefing_session_match.group(1).upper()
-        else:
-            fields["Briefing Session"] = ""
+        fields["Briefing Session"] = self.extract_yes_no(text, "Briefing Session", lowered)
         
         # Extract compulsory briefing info
-        compulsory_briefing_match = re.search(r"Compulsory Briefing\s*[:]\s*(Yes|No)", text, re.IGNORECASE)
-        if compulsory_briefing_match:
-            fields["Compulsory Briefing"] = compulsory_briefing_match.group(1).upper()
-        else:
-            fields["Compulsory Briefing"] = ""
+        fields["Compulsory Briefing"] = self.extract_yes_no(text, "Compulsory Briefing", lowered)
         
         # Extract briefing date and venue if briefing is Yes
         if fields["Briefing Session"].upper() == "YES" or fields["Compulsory Briefing"].upper() == "YES":
             # Look for date pattern after briefing info - capture full date with time
-            briefing_date_patterns = [
-                r"Date\s*[:]\s*([A-Za-z]+day,\s*\d{1,2}\s*[A-Za-z]+\s*\d{4}(?:\s*-?\s*\d{1,2}:\d{2}(?:[AP]M)?)?)",
-                r"Date\s*[:]\s*(\d{1,2}\s*[A-Za-z]+\s*\d{4}(?:\s*-?\s*\d{1,2}:\d{2}(?:[AP]M)?)?)",
-                r"Date\s*[:]\s*([^\n]+?)(?=\s*(?:Venue|$))"
-            ]
-            
-            for pattern in briefing_date_patterns:
-                briefing_date_match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            for pattern in _BRIEFING_DATE_RES:
+                briefing_date_match = pattern.search(text)
                 if briefing_date_match:
                     fields["Briefing Date"] = self.clean_value(briefing_date_match.group(1))
                     break
             
             # Extract venue
-            venue_pattern = r"Venue\s*[:]\s*([^:\n]+?)(?=\s*(?:Special Conditions|$))"
-            venue_match = re.search(venue_pattern, text, re.IGNORECASE | re.DOTALL)
+            venue_match = _VENUE_RE.search(lowered)
             if venue_match:
-                fields["Venue"] = self.clean_value(venue_match.group(1))
+                start, end = venue_match.span(1)
+                fields["Venue"] = self.clean_value(text[start:end])
         else:
             fields["Briefing Date"] = ""
             fields["Venue"] = ""
         
         # Extract special conditions
-        conditions_pattern = r"Special Conditions\s*[:]\s*(.*?)$"
-        conditions_match = re.search(conditions_pattern, text, re.DOTALL)
-        if conditions_match:
-            conditions = conditions_match.group(1).strip()
+        conditions = found.get('conditions')
+        if conditions is None:
+            conditions_match = _CONDITIONS_RE.search(text)
+            if conditions_match:
+                conditions = conditions_match.group(1)
+        if conditions is not None:
             # Clean up the conditions text
             conditions = self.clean_value(conditions)
             # Limit length if too long
@@ -291,7 +600,15 @@ class TenderScraper:
 
     def scrape_tender_details(self, tender_url):
         """Scrape detailed information from a tender page."""
-        print(f"Scraping details from {tender_url}")
+        return self._scrape_tender_details(tender_url)[0]
+
+    def _scrape_tender_details(self, tender_url):
+        """Scrape a tender page, returning its details and whether they were parsed.
+
+        The flag is False when the page could not be fetched or has no
+        details tab; the details are then left empty.
+        """
+        logger.debug("Scraping details from %s", tender_url)
 
         # Initialize with all required fields set to empty strings
         tender_details = {
@@ -315,90 +632,94 @@ class TenderScraper:
             'Description': ''
         }
 
+        parsed = False
         try:
-            soup = self.get_soup(tender_url)
+            content = self.fetch(tender_url)
+
+            # A page whose raw bytes never mention the section class cannot
+            # have a details section, so don't parse it at all
+            if _DETAILS_SECTION_MARKER not in content:
+                logger.debug("Details section not found")
+                return tender_details, False
+            tree = lxml.html.fromstring(content)
 
             # Find the section with tender details
-            details_section = soup.select_one('section.bg-light')
-            if not details_section:
-                print("Details section not found")
-                return tender_details
+            details_section = next(iter(_DETAILS_SECTION_XPATH(tree)), None)
+            if details_section is None:
+                logger.debug("Details section not found")
+                return tender_details, False
 
             # Get all the details from the active tab
-            details_tab = details_section.select_one('div.tab-pane.fade.active.show')
-            if not details_tab:
-                print("Details tab not found")
-                return tender_details
+            details_tab = next(iter(_DETAILS_TAB_XPATH(details_section)), None)
+            if details_tab is None:
+                logger.debug("Details tab not found")
+                return tender_details, False
 
             # Extract tender title
-            title_elem = details_section.select_one('h3')
-            if title_elem:
-                tender_details['Title'] = self.clean_value(title_elem.get_text(strip=True))
+            title_elem = next(iter(_TITLE_XPATH(details_section)), None)
+            if title_elem is not None:
+                tender_details['Title'] = self.clean_value(''.join(text.strip() for text in _iter_text(title_elem)))
 
             # Get all text from the details tab - IMPORTANT: Use '\n' as separator to preserve structure
-            all_text = details_tab.get_text(separator='\n', strip=False)
+            all_text = '\n'.join(_iter_text(details_tab))
             
-            # Debug: Print the text to see what we're working with
-            print("Extracted text:")
-            print(all_text[:500])  # Print first 500 chars for debugging
+            # Debug: Log the first 500 chars to see what we're working with
+            logger.debug("Extracted text:\n%.500s", all_text)
             
             # Parse the details from the text block
             parsed_fields = self.parse_detailed_text(all_text)
             tender_details.update(parsed_fields)
+            parsed = True
 
             # Alternative: Try getting text from individual elements
             if not tender_details['Opening Date'] or len(tender_details['Opening Date']) <= 2:
                 # Try to extract dates from individual p tags
-                p_tags = details_tab.find_all('p')
-                for p in p_tags:
-                    p_text = p.get_text(strip=True)
-                    if 'Opening Date:' in p_text:
-                        date_match = re.search(r'Opening Date:\s*(.+)', p_text)
-                        if date_match:
-                            tender_details['Opening Date'] = date_match.group(1).strip()
-                    elif 'Closing Date:' in p_text:
-                        date_match = re.search(r'Closing Date:\s*(.+)', p_text)
-                        if date_match:
-                            tender_details['Closing Date'] = date_match.group(1).strip()
-                    elif 'Modified Date:' in p_text:
-                        date_match = re.search(r'Modified Date:\s*(.+)', p_text)
-                        if date_match:
-                            tender_details['Modified Date'] = date_match.group(1).strip()
+                for p in details_tab.iter('p'):
+                    p_text = ''.join(text.strip() for text in _iter_text(p))
+                    for label in _P_DATE_LABELS:
+                        _, colon, value = p_text.partition(f'{label}:')
+                        if colon:
+                            # The value runs to the end of its first non-blank line
+                            value = value.lstrip().partition('\n')[0].strip()
+                            if value:
+                                tender_details[label] = value
+                            break
 
             # If we still don't have a description, use the bid description
             if not tender_details['Description'].strip() and tender_details['Bid Description']:
                 tender_details['Description'] = tender_details['Bid Description']
 
         except Exception as e:
-            print(f"Error scraping tender details: {e}")
+            logger.error("Error scraping tender details: %s", e)
 
-        return tender_details
+        return tender_details, parsed
 
-    def scrape_tenders(self):
-        """Scrape all new tenders from the website."""
+    def iter_tenders(self):
+        """Scrape new tenders from the website, yielding each one as it is ready."""
         page_num = 1
         any_new_tenders_found = False
 
         while True:
             page_new_tenders_found = False
             url = f"{self.base_url}?page={page_num}"
-            print(f"Scraping page {page_num}: {url}")
+            logger.debug("Scraping page %d: %s", page_num, url)
 
             try:
-                soup = self.get_soup(url)
+                soup = self.get_soup(url, parse_only=_SECTION_STRAINER)
 
                 # Find the section containing tender cards
                 tender_section = soup.select_one('section.bg-light')
                 if not tender_section:
-                    print("Tender section not found")
+                    logger.debug("Tender section not found")
                     break
 
                 # Find all tender cards
                 tender_cards = tender_section.select('div.card.w-100.mb-2.tender')
                 if not tender_cards:
-                    print("No tender cards found")
+                    logger.debug("No tender cards found")
                     break
 
+                page_tenders = []
                 for card in tender_cards:
                     # Check if this tender is new
                     new_badge = card.select_one('span.badge.badge-danger.card-badge')
@@ -419,20 +740,24 @@ class TenderScraper:
                             tender_info['Title'] = self.clean_value(link_tag.get_text(strip=True))
                             tender_info['URL'] = urljoin(self.base_url, link_tag.get('href', ''))
 
-                            # Scrape detailed info if we have a URL
-                            if tender_info['URL']:
-                                detailed_info = self.scrape_tender_details(tender_info['URL'])
-                                tender_info.update(detailed_info)
-
-                                # Add to our list of tenders
-                                self.tenders.append(tender_info)
-
-                                # Be nice to the server
-                                time.sleep(random.uniform(1, 3))
+                            # Scrape detailed info if we have a URL we haven't scraped before
+                            if tender_info['URL'] and tender_info['URL'] not in self.seen_urls:
+                                page_tenders.append(tender_info)
+
+                # Fetch the detail pages for this page's tenders concurrently
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    details = executor.map(self._scrape_tender_details, [tender['URL'] for tender in page_tenders])
+                    for tender_info, (detailed_info, parsed) in zip(page_tenders, details):
+                        tender_info.update(detailed_info)
+                        # Only remember tenders whose details were actually parsed;
+                        # a failed fetch is retried next run
+                        if self.seen_urls_path and parsed:
+                            self.seen_urls.add(tender_info['URL'])
+                        yield tender_info
 
                 # If we didn't find any new tenders on this page, stop scraping
                 if not page_new_tenders_found:
-                    print(f"No new tenders found on page {page_num}. Stopping scraping.")
+                    logger.debug("No new tenders found on page %d. Stopping scraping.", page_num)
                     break
 
                 # Continue to the next page
@@ -440,79 +765,58 @@ class TenderScraper:
                 
                 # Limit page scraping to avoid overwhelming the server
                 if page_num > 5:  # Adjust this number based on your needs
-                    print("Reached maximum page limit. Stopping scraping.")
+                    logger.debug("Reached maximum page limit. Stopping scraping.")
                     break
 
             except Exception as e:
-                print(f"Error scraping page {page_num}: {e}")
+                logger.error("Error scraping page %d: %s", page_num, e)
                 break
 
         # If we didn't find any new tenders across all pages, inform the user
         if not any_new_tenders_found:
-            print("No new tenders found.")
+            logger.info("No new tenders found.")
 
-        return self.tenders
+    def scrape_tenders(self):
+        """Scrape all new tenders from the website into a list."""
+        return list(self.iter_tenders())
 
-    def save_to_excel(self, filename='new_tenders.xlsx'):
-        """Save scraped tender data to an Excel file."""
-        if not self.tenders:
-            print("No tenders to save.")
-            return
+    def save_to_excel(self, tenders, filename='new_tenders.xlsx'):
+        """Stream tenders row by row into an Excel file and return how many were saved.
 
-        # Create a dataframe from the tender data
-        df = pd.DataFrame(self.tenders)
-
-        # Reorder columns to have important fields first
-        important_cols = [
-            'Title',
-            'URL',
-            'New',
-            'Tender Type',
-            'Bid Number',
-            'Department',
-            'Bid Description',
-            'Place where goods, works or services are required',
-            'Opening Date',
-            'Closing Date',
-            'Modified Date',
-            'Date Published',
-            'Enquiries/Contact Person',
-            'Email',
-            'Tel',
-            'Briefing Session',
-            'Compulsory Briefing',
-            'Briefing Date',
-            'Venue',
-            'Special Conditions',
-            'Description'
-        ]
-
-        # Keep only columns that exist in the DataFrame
-        cols = [col for col in important_cols if col in df.columns]
-        # Add any other columns that might be in the data but not in our priority list
-        other_cols = [col for col in df.columns if col not in important_cols]
-
-        # Create final column order
-        final_cols = cols + other_cols
-
-        # Reorder the DataFrame
-        df = df[final_cols]
-
-        # Save to Excel
-        df.to_excel(filename, index=False)
-        print(f"Saved {len(self.tenders)} tenders to {filename}")
+        The workbook is only created once the first tender arrives, so no file
+        is written when there is nothing to save.
+        """
+        workbook = None
+        count = 0
+        try:
+            for count, tender in enumerate(tenders, 1):
+                if workbook is None:
+                    # Rows are written in order, so each one can be flushed to disk
+                    workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+                    worksheet = workbook.add_worksheet()
+                    worksheet.write_row(0, 0, COLUMNS)
+                worksheet.write_row(count, 0, [tender.get(column, '') for column in COLUMNS])
+        finally:
+            if workbook is not None:
+                workbook.close()
+
+        if count:
+            logger.info("Saved %d tenders to %s", count, filename)
+        else:
+            logger.info("No tenders to save.")
+        return count
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     print("Starting EasyTenders scraper...")
-    scraper = TenderScraper()
-    tenders = scraper.scrape_tenders()
-
-    if not tenders:
-        print("No new tenders found. Exiting without creating Excel file.")
-        return
+    with TenderScraper(seen_urls_path='.seen_urls.json') as scraper:
+        if not scraper.save_to_excel(scraper.iter_tenders()):
+            print("No new tenders found. Exiting without creating Excel file.")
+            return
 
-    scraper.save_to_excel()
+        # Only remember the tenders once they are safely in the Excel file
+        scraper.save_seen_urls()
     print("Scraping completed.")
 
 
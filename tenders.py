@@ -1,51 +1,272 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import pandas as pd
 import time
 import random
 import re
 from urllib.parse import urljoin
-import gc
 import logging
+import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Output columns for saved tenders, important fields first
+COLUMNS = (
+    'Title',
+    'URL',
+    'New',
+    'Tender Type',
+    'Bid Number',
+    'Department',
+    'Bid Description',
+    'Place where goods, works or services are required',
+    'Opening Date',
+    'Closing Date',
+    'Modified Date',
+    'Date Published',
+    'Enquiries/Contact Person',
+    'Email',
+    'Tel',
+    'Briefing Session',
+    'Compulsory Briefing',
+    'Briefing Date',
+    'Venue',
+    'Special Conditions',
+    'Description'
+)
+
+# Every detail field starts out empty; parse_detailed_text only returns the
+# fields it actually found, which are laid over a copy of this template
+_EMPTY_FIELDS = MappingProxyType(dict.fromkeys(COLUMNS[3:], ''))
+
+# Regexes used while parsing tender details, compiled once at import
+_BID_NUMBER_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'RFQ NUMBER\s*(\d+/\d+)',
+    r'Request for Quotation\s*[:]\s*RFQ NUMBER\s*(\d+/\d+)',
+    r'Bid Number\s*[:]\s*([A-Z]{2,}/\d+/\d+/\d+)',
+    r'\b([A-Z]{2,}/\d+/\d+/\d+)\b',
+    r'\b([A-Z]{2,}/\d+/\d+)\b',
+    r'\b([A-Z]{2,}\d+/\d+)\b',
+    r'\b(\d+/\d+)\b'
+)]
+_TRAILING_COLON_RE = re.compile(r'[:]\s*$')
+
+# Date value patterns, most specific first
+_DATE_VALUE_PATTERNS = (
+    # Complete date with day name, date, and optional time
+    r"[A-Za-z]{3,9}day,\s*\d{1,2}\s*[A-Za-z]{3,9}\s*\d{4}(?:\s+\d{1,2}:\d{2}(?:\s*[AP]M)?)?",
+    # Date without day name
+    r"\d{1,2}\s*[A-Za-z]{3,9}\s*\d{4}(?:\s+\d{1,2}:\d{2}(?:\s*[AP]M)?)?",
+    # Everything until the next line or field
+    r"[^\n]+?(?=\n|$)",
+    # Everything until a double space or newline
+    r".+?(?=\s{2,}|\n|$)"
+)
+_DATE_STOP_WORDS = ("Enquiries", "Email", "Tel", "Briefing", "Department", "Bid Description", "Opening Date", "Closing Date", "Modified Date")
+
+# Compiled date patterns by prefix, filled in the first time a prefix is used
+_DATE_PATTERNS_CACHE = {}
+
+def _date_patterns(date_prefix):
+    """Return the (prefix, value patterns, fallback pattern, stop-word pattern) for a date prefix."""
+    patterns = _DATE_PATTERNS_CACHE.get(date_prefix)
+    if patterns is None:
+        prefix = re.escape(date_prefix)
+        patterns = (
+            re.compile(prefix, re.IGNORECASE),
+            tuple(re.compile(rf"{prefix}\s*[:]\s*({value})", re.IGNORECASE | re.DOTALL) for value in _DATE_VALUE_PATTERNS),
+            re.compile(rf"{prefix}\s*[:]\s*(\S.*?)(?=\s*\n|\s*$)", re.MULTILINE),
+            # One alternation finds the earliest following field in one pass
+            re.compile('|'.join(re.escape(word) for word in _DATE_STOP_WORDS if word != date_prefix))
+        )
+        _DATE_PATTERNS_CACHE[date_prefix] = patterns
+    return patterns
+
+_CONTACT_RES = [re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r"(?:Enquiries|Contact Person)\s*[:]\s*([^0-9,]+?)(?=\s*(?:Tel|Email|$))",
+    r"(?:Enquiries|Contact Person)\s*[:]\s*([^,]+?)(?=\s*(?:@|Tel|Email|$))"
+)]
+_CONTACT_NUMBER_RE = re.compile(r'[\d\(\)\-\+]+')
+_CONTACT_EMAIL_RE = re.compile(r'@.*')
+_EMAIL_FIELD_RE = re.compile(r'Email\s*[:]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:Tel|Phone)\s*[:]\s*((?:\+27|0)[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{4})',
+    r'(?:Tel|Phone)\s*[:]\s*(\d{3}[\s\-]?\d{3}[\s\-]?\d{4})',
+    r'(?:Tel|Phone)\s*[:]\s*(\d{10,})'
+)]
+_DESC_SPLIT_RE = re.compile(r'\s*(?:Place where)')
+_LOC_SPLIT_RE = re.compile(r'\s*(?:Opening Date|Closing Date)')
+# The tender types share their "Request for " prefix, so one search finds any of them
+_TENDER_TYPE_RE = re.compile(r"Request for (?:Quotation|Bid\(Open-Tender\)|Bid\(Limited-Tender\)|Proposal)")
+_BRIEFING_DATE_RE = re.compile(r"Date\s*[:]\s*([^\n]+?)(?=\s*(?:Venue|$))", re.IGNORECASE | re.MULTILINE)
+_VENUE_RE = re.compile(r"Venue\s*[:]\s*([^:\n]+?)(?=\s*(?:Special Conditions|$))", re.IGNORECASE | re.DOTALL)
+
+# One pattern per labelled field, each searched for on its own: every
+# pattern starts with its literal label, so the engine skips straight to the
+# label instead of trying the field patterns at every position. Each value
+# is captured in a "<key>_value" group inside a lookahead, so a long or empty
+# value never swallows the next label. Department, description and location
+# are only read from these. Where an extractor tries several patterns in
+# turn (bid number, dates, contact, tel), only its first is here and
+# parse_detailed_text falls back to the extractor.
+_FIELD_PATTERNS = {
+    'rfq_number': r"RFQ NUMBER(?=\s*(?P<rfq_number_value>\d+/\d+))",
+    'bid_number': r"Bid Number\s*[:](?=\s*(?P<bid_number_value>[A-Z]{2,}/\d+/\d+/\d+))",
+    'department': r"Department\s*[:](?=\s*(?P<department_value>[^\n]+?)(?=\s*(?:Bid Description|$)))",
+    'description': r"Bid Description\s*[:](?=\s*(?P<description_value>(?s:.*?))(?=\s*(?:Place where|Opening Date|Closing Date|$)))",
+    'location': r"Place where goods, works or services are required\s*[:](?=\s*(?P<location_value>(?s:.*?))(?=\s*(?:Opening Date|Closing Date|$)))",
+    'opening_date': rf"Opening Date\s*[:](?=\s*(?P<opening_date_value>{_DATE_VALUE_PATTERNS[0]}))",
+    'closing_date': rf"Closing Date\s*[:](?=\s*(?P<closing_date_value>{_DATE_VALUE_PATTERNS[0]}))",
+    'modified_date': rf"Modified Date\s*[:](?=\s*(?P<modified_date_value>{_DATE_VALUE_PATTERNS[0]}))",
+    'date_published': rf"Date Published\s*[:](?=\s*(?P<date_published_value>{_DATE_VALUE_PATTERNS[0]}))",
+    'contact': r"(?:Enquiries|Contact Person)\s*[:](?=\s*(?P<contact_value>[^0-9,]+?)(?=\s*(?:Tel|Email|$)))",
+    'email': r"Email\s*[:](?=\s*(?P<email_value>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}))",
+    'tel': r"(?:Tel|Phone)\s*[:](?=\s*(?P<tel_value>(?:\+27|0)[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{4}))",
+    'briefing_session': r"Briefing Session\s*[:](?=\s*(?P<briefing_session_value>Yes|No))",
+    'compulsory_briefing': r"Compulsory Briefing\s*[:](?=\s*(?P<compulsory_briefing_value>Yes|No))",
+    'conditions': r"(?-i:Special Conditions)\s*[:](?=\s*(?P<conditions_value>(?s:.*?))$)",
+}
+_FIELD_RES = {
+    key: re.compile(pattern, re.IGNORECASE) for key, pattern in _FIELD_PATTERNS.items()
+}
+
+def _has_classes(*classes):
+    """XPath predicate matching elements that carry every given class."""
+    return ' and '.join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')" for cls in classes
+    )
+
+# Pages are walked with lxml directly; these mirror the CSS selectors the
+# scraper used with BeautifulSoup
+_SECTION_XPATH = etree.XPath(f"//section[{_has_classes('bg-light')}]")
+_CARDS_XPATH = etree.XPath(f".//div[{_has_classes('card', 'w-100', 'mb-2', 'tender')}]")
+# Only the cards whose (first) badge reads NEW, so old cards never reach Python
+_NEW_CARDS_XPATH = etree.XPath(
+    f".//div[{_has_classes('card', 'w-100', 'mb-2', 'tender')}]"
+    f"[(.//span[{_has_classes('badge', 'badge-danger', 'card-badge')}])[1][contains(., 'NEW')]]"
+)
+_LINK_XPATH = etree.XPath(".//a")
+_DETAILS_TAB_XPATH = etree.XPath(f".//div[{_has_classes('tab-pane', 'fade', 'active', 'show')}]")
+_TITLE_XPATH = etree.XPath(".//h3")
+
+# Bytes read from the socket at a time while streaming a page into lxml
+_CHUNK_SIZE = 64 * 1024
+# Larger pages are abandoned - tender pages are well under this
+_MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+
+def _strip_phone_separators(phone):
+    """Drop the whitespace and hyphens from a phone number."""
+    # str.split() splits on exactly the characters \s matches
+    return ''.join(phone.split()).replace('-', '')
+
+def _first(xpath, element):
+    """Return the first element an XPath matches, or None."""
+    return next(iter(xpath(element)), None)
+
+def _iter_text(element):
+    """Yield the text nodes under an element, as BeautifulSoup's get_text does.
+
+    Comments and the contents of script and style elements are skipped.
+    """
+    if element.text and element.tag not in ('script', 'style'):
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in ('script', 'style'):
+            yield from _iter_text(child)
+        if child.tail:
+            yield child.tail
+
+class RateLimiter:
+    """Space request starts out across threads, with some jitter."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval * random.uniform(0.5, 1.5)
+        if slot > now:
+            time.sleep(slot - now)
+
 class TenderScraper:
-    def __init__(self, base_url='https://easytenders.co.za/tenders', max_pages=3):
+    def __init__(self, base_url='https://easytenders.co.za/tenders', max_pages=3, max_workers=8,
+                 request_interval=1.5):
         """
         Initialize the tender scraper with memory optimizations.
         
         Args:
             base_url: The base URL for scraping
             max_pages: Maximum number of pages to scrape (to limit memory usage)
+            max_workers: Number of detail pages fetched concurrently
+            request_interval: Average number of seconds between request starts
         """
         self.base_url = base_url
         self.max_pages = max_pages
+        self.max_workers = max_workers
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
         }
         self.tenders = []
         
-        # Add request session for connection pooling
+        # Reuse keep-alive connections to the tender site across requests,
+        # retrying transient failures with backoff
         self.session = requests.Session()
-
-    def __del__(self):
-        """Clean up resources when object is destroyed."""
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Be nice to the server - detail pages are fetched concurrently, but
+        # request starts are still spaced out
+        self.rate_limiter = RateLimiter(request_interval)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
         self.session.close()
 
-    def get_soup(self, url):
-        """Make a request to the URL and return a BeautifulSoup object."""
+    def get_tree(self, url):
+        """Make a request to the URL and return the parsed lxml HTML tree."""
         try:
-            response = self.session.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            # Use lxml parser for better performance
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Free memory
-            del response
-            return soup
+            self.rate_limiter.wait()
+            # Feed the body to lxml as it arrives, so it is never held whole
+            # as bytes or decoded to a str
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # A charset in the Content-Type header wins; otherwise lxml
+                # takes it from the page's <meta> tag
+                encoding = None
+                if 'charset' in response.headers.get('Content-Type', '').lower():
+                    encoding = response.encoding
+                parser = lxml.html.HTMLParser(encoding=encoding)
+                received = 0
+                for chunk in response.iter_content(_CHUNK_SIZE):
+                    received += len(chunk)
+                    if received > _MAX_RESPONSE_BYTES:
+                        raise RuntimeError(f"Response larger than {_MAX_RESPONSE_BYTES} bytes")
+                    parser.feed(chunk)
+            return parser.close()
         except Exception as e:
             logger.error(f"Error fetching URL {url}: {str(e)}")
             raise
@@ -54,33 +275,16 @@ class TenderScraper:
         """Clean a value by removing extra whitespace and newlines."""
         if not value:
             return ""
-        return " ".join(value.strip().split())
-
-    def extract_department_only(self, text):
-        """Extract only the department name from text."""
-        # Look for department pattern - stop at next field (Bid Description)
-        dept_pattern = r"Department\s*[:]\s*([^\n]+?)(?=\s*(?:Bid Description|$))"
-        dept_match = re.search(dept_pattern, text, re.IGNORECASE)
-        if dept_match:
-            dept_text = dept_match.group(1).strip()
-            return self.clean_value(dept_text)
-        return ""
+        # Already normalized: no whitespace other than single spaces
+        if '  ' not in value and value.isprintable():
+            return value.strip()
+        return " ".join(value.split())
 
     def extract_bid_number_only(self, text):
         """Extract only the bid number from text."""
         # Look for RFQ NUMBER or bid number patterns
-        patterns = [
-            r'RFQ NUMBER\s*(\d+/\d+)',
-            r'Request for Quotation\s*[:]\s*RFQ NUMBER\s*(\d+/\d+)',
-            r'Bid Number\s*[:]\s*([A-Z]{2,}/\d+/\d+/\d+)',
-            r'\b([A-Z]{2,}/\d+/\d+/\d+)\b',
-            r'\b([A-Z]{2,}/\d+/\d+)\b',
-            r'\b([A-Z]{2,}\d+/\d+)\b',
-            r'\b(\d+/\d+)\b'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _BID_NUMBER_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return ""
@@ -93,7 +297,7 @@ class TenderScraper:
         if match:
             value = match.group(1).strip()
             # Remove any trailing colons or special characters
-            value = re.sub(r'[:]\s*$', '', value)
+            value = _TRAILING_COLON_RE.sub('', value)
             return self.clean_value(value)
         return ""
 
@@ -101,201 +305,181 @@ class TenderScraper:
         """Extract a complete date with a specific prefix."""
         # Simplified date extraction to reduce logging and improve performance
         
-        # First, try to find the date field and everything after it until the next field
-        text_from_prefix = text[text.find(date_prefix):] if date_prefix in text else ""
+        prefix_pattern, value_patterns, fallback_pattern, _ = _date_patterns(date_prefix)
         
-        # More comprehensive patterns to capture full date strings
-        patterns = [
-            # Pattern for complete date with day name, date, and optional time - most specific first
-            rf"{date_prefix}\s*[:]\s*([A-Za-z]{{3,9}}day,\s*\d{{1,2}}\s*[A-Za-z]{{3,9}}\s*\d{{4}}(?:\s+\d{{1,2}}:\d{{2}}(?:\s*[AP]M)?)?)",
-            # Pattern for date without day name
-            rf"{date_prefix}\s*[:]\s*(\d{{1,2}}\s*[A-Za-z]{{3,9}}\s*\d{{4}}(?:\s+\d{{1,2}}:\d{{2}}(?:\s*[AP]M)?)?)",
-            # Pattern to capture until next line or field
-            rf"{date_prefix}\s*[:]\s*([^\n]+?)(?=\n|$)",
-            # Most general pattern - capture everything until double space or newline
-            rf"{date_prefix}\s*[:]\s*(.+?)(?=\s{{2,}}|\n|$)"
-        ]
+        # Every pattern starts with the prefix, so none can match before its
+        # first occurrence - and without one there is nothing to find
+        prefix_match = prefix_pattern.search(text)
+        if not prefix_match:
+            return ""
+        start = prefix_match.start()
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        # More comprehensive patterns to capture full date strings
+        for pattern in value_patterns:
+            match = pattern.search(text, start)
             if match:
-                date_text = match.group(1).strip()
-                
-                # Clean up but preserve the full date
-                date_text = " ".join(date_text.split())
-                
-                # Make sure we didn't capture another field
-                stop_words = ["Enquiries", "Email", "Tel", "Briefing", "Department", "Bid Description", "Opening Date", "Closing Date", "Modified Date"]
-                for stop_word in stop_words:
-                    if stop_word in date_text and stop_word != date_prefix:
-                        date_text = date_text.split(stop_word)[0].strip()
-                        break
+                date_text = self.clean_date(match.group(1), date_prefix)
                 
                 # Final check - if we only have a single character, something went wrong
                 if len(date_text) > 1:
                     return date_text
         
-        # If we still haven't found anything, try a simpler approach
-        simple_match = re.search(rf"{date_prefix}\s*[:]\s*(\S.*?)(?=\s*\n|\s*$)", text, re.MULTILINE)
+        # If we still haven't found anything, try a simpler approach - cut at
+        # the next field too, or a date left empty by the cut above would come
+        # back here with that field attached
+        simple_match = fallback_pattern.search(text, start)
         if simple_match:
-            return simple_match.group(1).strip()
+            return self.clean_date(simple_match.group(1), date_prefix)
         
         return ""
 
+    def clean_date(self, date_text, date_prefix):
+        """Normalise a captured date and cut off any following field."""
+        # Clean up but preserve the full date
+        date_text = " ".join(date_text.split())
+        
+        # Make sure we didn't capture another field
+        stop_match = _date_patterns(date_prefix)[3].search(date_text)
+        if stop_match:
+            date_text = date_text[:stop_match.start()].strip()
+        return date_text
+
+    def clean_contact_person(self, name):
+        """Strip phone numbers and email parts from a captured contact name."""
+        name = _CONTACT_NUMBER_RE.sub('', name)
+        name = _CONTACT_EMAIL_RE.sub('', name)
+        return self.clean_value(name)
+
     def extract_contact_person(self, text):
         """Extract only the contact person name."""
-        patterns = [
-            r"(?:Enquiries|Contact Person)\s*[:]\s*([^0-9,]+?)(?=\s*(?:Tel|Email|$))",
-            r"(?:Enquiries|Contact Person)\s*[:]\s*([^,]+?)(?=\s*(?:@|Tel|Email|$))"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        for pattern in _CONTACT_RES:
+            match = pattern.search(text)
             if match:
-                name = match.group(1).strip()
-                # Remove any phone numbers or email parts
-                name = re.sub(r'[\d\(\)\-\+]+', '', name)
-                name = re.sub(r'@.*', '', name)
-                return self.clean_value(name)
+                return self.clean_contact_person(match.group(1))
         return ""
     
     def extract_email_only(self, text):
         """Extract only the email address."""
         # First check if there's an explicit Email: field
-        email_field_pattern = r'Email\s*[:]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
-        email_field_match = re.search(email_field_pattern, text, re.IGNORECASE)
+        email_field_match = _EMAIL_FIELD_RE.search(text)
         if email_field_match:
             return email_field_match.group(1).lower()
         
         # If not, look for any email address in the text
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             return email_match.group(0).lower()
         return ""
 
     def extract_phone_only(self, text):
         """Extract only the phone number."""
-        phone_patterns = [
-            r'(?:Tel|Phone)\s*[:]\s*((?:\+27|0)[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{4})',
-            r'(?:Tel|Phone)\s*[:]\s*(\d{3}[\s\-]?\d{3}[\s\-]?\d{4})',
-            r'(?:Tel|Phone)\s*[:]\s*(\d{10,})'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PHONE_RES:
+            match = pattern.search(text)
             if match:
                 phone = match.group(1).strip()
                 # Normalize phone format
-                phone = re.sub(r'[\s\-]', '', phone)
+                phone = _strip_phone_separators(phone)
                 return phone
         return ""
 
-    def extract_description_only(self, text):
-        """Extract only the bid description."""
-        desc_pattern = r"Bid Description\s*[:]\s*(.*?)(?=\s*(?:Place where|Opening Date|Closing Date|$))"
-        desc_match = re.search(desc_pattern, text, re.DOTALL | re.IGNORECASE)
-        if desc_match:
-            desc = desc_match.group(1).strip()
-            # Remove any location info that might have been captured
-            desc = re.split(r'\s*(?:Place where)', desc)[0]
-            return self.clean_value(desc)
-        return ""
-
-    def extract_location_only(self, text):
-        """Extract only the location/place information."""
-        loc_pattern = r"Place where goods, works or services are required\s*[:]\s*(.*?)(?=\s*(?:Opening Date|Closing Date|$))"
-        loc_match = re.search(loc_pattern, text, re.DOTALL | re.IGNORECASE)
-        if loc_match:
-            location = loc_match.group(1).strip()
-            # Remove any date info that might have been captured
-            location = re.split(r'\s*(?:Opening Date|Closing Date)', location)[0]
-            return self.clean_value(location)
-        return ""
-
     def parse_detailed_text(self, text):
-        """Parse a text block to extract structured fields with memory optimization."""
+        """Parse a text block to extract structured fields with memory optimization.
+
+        Only the fields that were found are returned; the caller lays them
+        over a copy of _EMPTY_FIELDS.
+        """
         fields = {}
         
         # Extract the tender type (Request for Quotation, Request for Bid, etc.)
-        tender_types = [
-            "Request for Quotation", 
-            "Request for Bid(Open-Tender)", 
-            "Request for Bid(Limited-Tender)", 
-            "Request for Proposal"
-        ]
+        tender_type_match = _TENDER_TYPE_RE.search(text)
+        if tender_type_match:
+            fields["Tender Type"] = tender_type_match.group()
         
-        for tender_type in tender_types:
-            if tender_type in text:
-                fields["Tender Type"] = tender_type
-                break
+        # Collect the first value of every labelled field; the single-field
+        # extractors only run for fields that were not found
+        found = {}
+        for key, pattern in _FIELD_RES.items():
+            match = pattern.search(text)
+            if match:
+                found[key] = match.group(f"{key}_value")
         
         # Extract specific fields using improved extraction methods
-        fields["Bid Number"] = self.extract_bid_number_only(text)
-        fields["Department"] = self.extract_department_only(text)
-        fields["Bid Description"] = self.extract_description_only(text)
-        fields["Place where goods, works or services are required"] = self.extract_location_only(text)
+        if 'rfq_number' in found or 'bid_number' in found:
+            fields["Bid Number"] = found.get('rfq_number') or found['bid_number']
+        else:
+            fields["Bid Number"] = self.extract_bid_number_only(text)
+        
+        if 'department' in found:
+            fields["Department"] = self.clean_value(found['department'])
+        
+        if 'description' in found:
+            desc = _DESC_SPLIT_RE.split(found['description'].strip())[0]
+            fields["Bid Description"] = self.clean_value(desc)
+        
+        if 'location' in found:
+            location = _LOC_SPLIT_RE.split(found['location'].strip())[0]
+            fields["Place where goods, works or services are required"] = self.clean_value(location)
         
         # Extract dates
-        fields["Opening Date"] = self.extract_date(text, "Opening Date")
-        fields["Closing Date"] = self.extract_date(text, "Closing Date")
-        fields["Modified Date"] = self.extract_date(text, "Modified Date")
-        fields["Date Published"] = self.extract_date(text, "Date Published")
+        for key, date_prefix in (
+            ('opening_date', "Opening Date"),
+            ('closing_date', "Closing Date"),
+            ('modified_date', "Modified Date"),
+            ('date_published', "Date Published")
+        ):
+            date_text = self.clean_date(found[key], date_prefix) if key in found else ""
+            if len(date_text) <= 1:
+                date_text = self.extract_date(text, date_prefix)
+            fields[date_prefix] = date_text
         
         # Extract contact information
-        fields["Enquiries/Contact Person"] = self.extract_contact_person(text)
-        fields["Email"] = self.extract_email_only(text)
-        fields["Tel"] = self.extract_phone_only(text)
+        if 'contact' in found:
+            fields["Enquiries/Contact Person"] = self.clean_contact_person(found['contact'])
+        else:
+            fields["Enquiries/Contact Person"] = self.extract_contact_person(text)
+        
+        if 'email' in found:
+            fields["Email"] = found['email'].lower()
+        else:
+            fields["Email"] = self.extract_email_only(text)
+        
+        if 'tel' in found:
+            fields["Tel"] = _strip_phone_separators(found['tel'])
+        else:
+            fields["Tel"] = self.extract_phone_only(text)
         
         # Extract briefing session info
         # Check for "Briefing Session: Yes/No"
-        briefing_session_match = re.search(r"Briefing Session\s*[:]\s*(Yes|No)", text, re.IGNORECASE)
-        if briefing_session_match:
-            fields["Briefing Session"] = briefing_session_match.group(1).upper()
-        else:
-            fields["Briefing Session"] = ""
+        briefing_session = found.get('briefing_session', '').upper()
+        if briefing_session:
+            fields["Briefing Session"] = briefing_session
         
         # Extract compulsory briefing info
-        compulsory_briefing_match = re.search(r"Compulsory Briefing\s*[:]\s*(Yes|No)", text, re.IGNORECASE)
-        if compulsory_briefing_match:
-            fields["Compulsory Briefing"] = compulsory_briefing_match.group(1).upper()
-        else:
-            fields["Compulsory Briefing"] = ""
+        compulsory_briefing = found.get('compulsory_briefing', '').upper()
+        if compulsory_briefing:
+            fields["Compulsory Briefing"] = compulsory_briefing
         
         # Only process briefing info if needed
-        if fields["Briefing Session"].upper() == "YES" or fields["Compulsory Briefing"].upper() == "YES":
+        if briefing_session == "YES" or compulsory_briefing == "YES":
             # Extract briefing date
-            briefing_date_pattern = r"Date\s*[:]\s*([^\n]+?)(?=\s*(?:Venue|$))"
-            briefing_date_match = re.search(briefing_date_pattern, text, re.IGNORECASE | re.MULTILINE)
+            briefing_date_match = _BRIEFING_DATE_RE.search(text)
             if briefing_date_match:
                 fields["Briefing Date"] = self.clean_value(briefing_date_match.group(1))
-            else:
-                fields["Briefing Date"] = ""
             
             # Extract venue
-            venue_pattern = r"Venue\s*[:]\s*([^:\n]+?)(?=\s*(?:Special Conditions|$))"
-            venue_match = re.search(venue_pattern, text, re.IGNORECASE | re.DOTALL)
+            venue_match = _VENUE_RE.search(text)
             if venue_match:
                 fields["Venue"] = self.clean_value(venue_match.group(1))
-            else:
-                fields["Venue"] = ""
-        else:
-            fields["Briefing Date"] = ""
-            fields["Venue"] = ""
         
         # Extract special conditions (limit size to avoid memory bloat)
-        conditions_pattern = r"Special Conditions\s*[:]\s*(.*?)$"
-        conditions_match = re.search(conditions_pattern, text, re.DOTALL)
-        if conditions_match:
-            conditions = conditions_match.group(1).strip()
+        if 'conditions' in found:
+            conditions = found['conditions']
             # Clean up and limit length
             conditions = self.clean_value(conditions)
             # Limit length if too long
             if len(conditions) > 500:
                 conditions = conditions[:497] + "..."
             fields["Special Conditions"] = conditions
-        else:
-            fields["Special Conditions"] = ""
         
         return fields
 
@@ -304,50 +488,31 @@ class TenderScraper:
         logger.info(f"Scraping details from {tender_url}")
 
         # Initialize with all required fields set to empty strings
-        tender_details = {
-            'Tender Type': '',
-            'Bid Number': '',
-            'Department': '',
-            'Bid Description': '',
-            'Place where goods, works or services are required': '',
-            'Opening Date': '',
-            'Closing Date': '',
-            'Modified Date': '',
-            'Date Published': '',
-            'Enquiries/Contact Person': '',
-            'Email': '',
-            'Tel': '',
-            'Briefing Session': '',
-            'Compulsory Briefing': '',
-            'Briefing Date': '',
-            'Venue': '',
-            'Special Conditions': '',
-            'Description': '',
-            'URL': tender_url  # Store the URL for reference
-        }
+        tender_details = dict(_EMPTY_FIELDS)
+        tender_details['URL'] = tender_url  # Store the URL for reference
 
         try:
-            soup = self.get_soup(tender_url)
+            tree = self.get_tree(tender_url)
 
             # Find the section with tender details
-            details_section = soup.select_one('section.bg-light')
-            if not details_section:
+            details_section = _first(_SECTION_XPATH, tree)
+            if details_section is None:
                 logger.warning("Details section not found")
                 return tender_details
 
             # Get all the details from the active tab
-            details_tab = details_section.select_one('div.tab-pane.fade.active.show')
-            if not details_tab:
+            details_tab = _first(_DETAILS_TAB_XPATH, details_section)
+            if details_tab is None:
                 logger.warning("Details tab not found")
                 return tender_details
 
             # Extract tender title
-            title_elem = details_section.select_one('h3')
-            if title_elem:
-                tender_details['Title'] = self.clean_value(title_elem.get_text(strip=True))
+            title_elem = _first(_TITLE_XPATH, details_section)
+            if title_elem is not None:
+                tender_details['Title'] = self.clean_value(''.join(text.strip() for text in _iter_text(title_elem)))
 
             # Get all text from the details tab - IMPORTANT: Use '\n' as separator to preserve structure
-            all_text = details_tab.get_text(separator='\n', strip=False)
+            all_text = '\n'.join(_iter_text(details_tab))
             
             # Parse the details from the text block
             parsed_fields = self.parse_detailed_text(all_text)
@@ -356,11 +521,6 @@ class TenderScraper:
             # If we still don't have a description, use the bid description
             if not tender_details['Description'].strip() and tender_details['Bid Description']:
                 tender_details['Description'] = tender_details['Bid Description']
-                
-            # Free memory
-            del soup
-            del all_text
-            gc.collect()
 
         except Exception as e:
             logger.error(f"Error scraping tender details: {e}")
@@ -368,12 +528,21 @@ class TenderScraper:
         return tender_details
 
     def scrape_tenders(self):
-        """Scrape tenders from the website with memory optimization."""
-        page_num = 1
-        any_new_tenders_found = False
+        """
+        Scrape tenders from the website and keep them for save_to_excel.
         
+        Returns:
+            The list of scraped tenders.
+        """
         # Clear existing tenders to free memory
         self.tenders = []
+        self.tenders.extend(self.iter_tenders())
+        return self.tenders
+
+    def iter_tenders(self):
+        """Scrape tenders from the website, yielding each one as it is scraped."""
+        page_num = 1
+        any_new_tenders_found = False
 
         while page_num <= self.max_pages:
             page_new_tenders_found = False
@@ -381,66 +550,51 @@ class TenderScraper:
             logger.info(f"Scraping page {page_num}: {url}")
 
             try:
-                soup = self.get_soup(url)
+                tree = self.get_tree(url)
 
                 # Find the section containing tender cards
-                tender_section = soup.select_one('section.bg-light')
-                if not tender_section:
+                tender_section = _first(_SECTION_XPATH, tree)
+                if tender_section is None:
                     logger.warning("Tender section not found")
                     break
 
-                # Find all tender cards
-                tender_cards = tender_section.select('div.card.w-100.mb-2.tender')
-                if not tender_cards:
+                # Find the new tender cards
+                new_cards = _NEW_CARDS_XPATH(tender_section)
+                if not new_cards and _first(_CARDS_XPATH, tender_section) is None:
                     logger.warning("No tender cards found")
                     break
 
-                # How many cards to process in this batch before garbage collection
-                batch_size = 5
-                current_batch = 0
-
-                for card in tender_cards:
-                    # Check if this tender is new
-                    new_badge = card.select_one('span.badge.badge-danger.card-badge')
-                    if new_badge and "NEW" in new_badge.get_text():
-                        page_new_tenders_found = True
-                        any_new_tenders_found = True
-
-                        # Basic tender info from the card
-                        tender_info = {
-                            'URL': '',
-                            'Title': '',
-                            'New': True
-                        }
-
-                        # Get tender title and URL
-                        link_tag = card.select_one('a')
-                        if link_tag:
-                            tender_info['Title'] = self.clean_value(link_tag.get_text(strip=True))
-                            tender_info['URL'] = urljoin(self.base_url, link_tag.get('href', ''))
-
-                            # Scrape detailed info if we have a URL
-                            if tender_info['URL']:
-                                detailed_info = self.scrape_tender_details(tender_info['URL'])
-                                tender_info.update(detailed_info)
-
-                                # Add to our list of tenders
-                                self.tenders.append(tender_info)
-
-                                # Be nice to the server and prevent memory buildup
-                                time.sleep(random.uniform(1, 2))
-                                
-                                # Increment batch counter
-                                current_batch += 1
-                                
-                                # Perform garbage collection every batch_size cards
-                                if current_batch >= batch_size:
-                                    current_batch = 0
-                                    gc.collect()
-
-                # Free memory before moving to the next page
-                del soup
-                gc.collect()
+                if new_cards:
+                    page_new_tenders_found = True
+                    any_new_tenders_found = True
+
+                page_tenders = []
+                for card in new_cards:
+                    # Basic tender info from the card
+                    tender_info = {
+                        'URL': '',
+                        'Title': '',
+                        'New': True
+                    }
+
+                    # Get tender title and URL
+                    link_tag = _first(_LINK_XPATH, card)
+                    if link_tag is not None:
+                        tender_info['Title'] = self.clean_value(''.join(text.strip() for text in _iter_text(link_tag)))
+                        tender_info['URL'] = urljoin(self.base_url, link_tag.get('href', ''))
+
+                        # Scrape detailed info if we have a URL
+                        if tender_info['URL']:
+                            page_tenders.append(tender_info)
+
+                # Fetch the detail pages for this page's tenders concurrently,
+                # yielding them in card order
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    details = executor.map(self.scrape_tender_details, [tender['URL'] for tender in page_tenders])
+                    for tender_info, detailed_info in zip(page_tenders, details):
+                        tender_info.update(detailed_info)
+
+                        yield tender_info
 
                 # If we didn't find any new tenders on this page, stop scraping
                 if not page_new_tenders_found:
@@ -454,69 +608,40 @@ class TenderScraper:
                 logger.error(f"Error scraping page {page_num}: {e}")
                 break
 
-        # Final garbage collection
-        gc.collect()
-
         # If we didn't find any new tenders across all pages, inform the user
         if not any_new_tenders_found:
             logger.info("No new tenders found.")
 
-        return self.tenders
-
     def save_to_excel(self, filename='new_tenders.xlsx'):
-        """Save scraped tender data to an Excel file."""
+        """Save scraped tender data to an Excel file, or to CSV if filename ends in .csv."""
+        if filename.endswith('.csv'):
+            return self.save_to_csv(filename)
+
         if not self.tenders:
             logger.info("No tenders to save.")
             return
 
         try:
-            # Create a dataframe from the tender data
-            df = pd.DataFrame(self.tenders)
-
-            # Reorder columns to have important fields first
-            important_cols = [
-                'Title',
-                'URL',
-                'New',
-                'Tender Type',
-                'Bid Number',
-                'Department',
-                'Bid Description',
-                'Place where goods, works or services are required',
-                'Opening Date',
-                'Closing Date',
-                'Modified Date',
-                'Date Published',
-                'Enquiries/Contact Person',
-                'Email',
-                'Tel',
-                'Briefing Session',
-                'Compulsory Briefing',
-                'Briefing Date',
-                'Venue',
-                'Special Conditions',
-                'Description'
-            ]
-
-            # Keep only columns that exist in the DataFrame
-            cols = [col for col in important_cols if col in df.columns]
-            # Add any other columns that might be in the data but not in our priority list
-            other_cols = [col for col in df.columns if col not in important_cols]
-
-            # Create final column order
-            final_cols = cols + other_cols
-
-            # Reorder the DataFrame
-            df = df[final_cols]
-
-            # Save to Excel with optimized settings
-            df.to_excel(filename, index=False, engine='openpyxl')
+            df = pd.DataFrame(self.tenders, columns=COLUMNS)
+
+            # xlsxwriter only writes, so it skips openpyxl's in-memory workbook model
+            df.to_excel(filename, index=False, engine='xlsxwriter')
             logger.info(f"Saved {len(self.tenders)} tenders to {filename}")
             
-            # Clean up
-            del df
-            gc.collect()
-            
         except Exception as e:
             logger.error(f"Error saving tenders to Excel: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def save_to_csv(self, filename='new_tenders.csv'):
+        """Save scraped tender data to a CSV file - much faster than Excel for large results."""
+        if not self.tenders:
+            logger.info("No tenders to save.")
+            return
+
+        try:
+            pd.DataFrame(self.tenders, columns=COLUMNS).to_csv(filename, index=False)
+            logger.info(f"Saved {len(self.tenders)} tenders to {filename}")
+            
+        except Exception as e:
+            logger.error(f"Error saving tenders to CSV: {e}")
+            raise
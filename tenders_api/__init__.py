@@ -0,0 +1,3 @@
+from tenders_api.routes import bp
+
+__all__ = ['bp']
@@ -0,0 +1,26 @@
+import os
+import tempfile
+
+from tenders import COLUMNS
+
+# Generated workbooks are kept on local disk so they can be fetched as a binary
+# download instead of only inline as base64. Only the instance that built a
+# workbook can serve it, so downloadUrl is best-effort; excelData stays the
+# dependable copy.
+DOWNLOAD_DIR = os.path.join(tempfile.gettempdir(), 'tender_outputs')
+DOWNLOAD_TTL = 60 * 60  # Seconds a workbook stays available for download
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+SCRAPE_CACHE_TTL = 5 * 60  # Seconds a scrape result is re-used for the same max_pages
+
+# Larger workbooks are only offered through downloadUrl: base64 grows them by a
+# third and Cloud Functions rejects responses over 10 MB
+INLINE_EXCEL_MAX_BYTES = 7 * 1024 * 1024
+
+# Columns written to the Excel export, in output order
+ALL_COLUMNS = COLUMNS
+
+# Essential columns returned in the JSON response (kept small to reduce memory)
+ESSENTIAL_COLUMNS = (
+    'Title', 'URL', 'Bid Number', 'Department',
+    'Bid Description', 'Closing Date', 'Email', 'Tel'
+)
@@ -0,0 +1,216 @@
+from flask import Blueprint, jsonify, request, send_from_directory
+import os
+import tempfile
+import threading
+import time
+import uuid
+from operator import itemgetter
+import xlsxwriter
+import datetime
+import hashlib
+import pybase64  # SIMD base64 encoder, drop-in for the stdlib base64 module
+from io import BytesIO
+import logging
+import traceback
+from cachetools import TTLCache
+from werkzeug.exceptions import NotFound
+
+from tenders import TenderScraper
+from tenders_api.config import (
+    ALL_COLUMNS, DOWNLOAD_DIR, DOWNLOAD_TTL, ESSENTIAL_COLUMNS,
+    INLINE_EXCEL_MAX_BYTES, SCRAPE_CACHE_TTL, XLSX_MIMETYPE
+)
+
+logger = logging.getLogger(__name__)
+
+bp = Blueprint('tenders', __name__)
+
+# Pull a tender's cells out in column order in a single C-level call; the
+# scraper starts every tender from _EMPTY_FIELDS, so each column is present
+ALL_COLUMNS_GETTER = itemgetter(*ALL_COLUMNS)
+ESSENTIAL_COLUMNS_GETTER = itemgetter(*ESSENTIAL_COLUMNS)
+
+# Recent scrape results by max_pages, so repeated requests skip re-crawling
+SCRAPE_CACHE = TTLCache(maxsize=8, ttl=SCRAPE_CACHE_TTL)
+SCRAPE_CACHE_LOCK = threading.Lock()
+
+@bp.route('/api/health', methods=['GET'])
+def health_check():
+    """Simple endpoint to check if the server is running."""
+    return jsonify({"status": "healthy"})
+
+def store_download(data, filename):
+    """Save a generated workbook for download and remove expired ones."""
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    
+    cutoff = time.time() - DOWNLOAD_TTL
+    for name in os.listdir(DOWNLOAD_DIR):
+        path = os.path.join(DOWNLOAD_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass  # Already removed by another worker
+    
+    # Write under a temporary name and rename into place, so a download never
+    # sees a partly written workbook and a failed write leaves nothing behind
+    tf = tempfile.NamedTemporaryFile(dir=DOWNLOAD_DIR, suffix='.part', delete=False)
+    try:
+        with tf:
+            tf.write(data)
+        os.replace(tf.name, os.path.join(DOWNLOAD_DIR, filename))
+    except OSError:
+        os.remove(tf.name)
+        raise
+
+def etag_matches(etag):
+    """Whether the request's If-None-Match names the given ETag."""
+    # Flask-Compress sends compressed responses with the ETag "<etag>:<algorithm>",
+    # and clients echo that back, so compare without the suffix
+    return request.if_none_match.star_tag or any(
+        tag.partition(':')[0] == etag for tag in request.if_none_match
+    )
+
+def run_scrape(max_pages):
+    """
+    Scrape tenders and build the Excel export, re-using a recent result for
+    the same max_pages if there is one.
+    
+    Args:
+        max_pages: Maximum number of listing pages to scrape
+    
+    Returns:
+        The (result, excel_bytes) tuple from scrape_and_export.
+    """
+    with SCRAPE_CACHE_LOCK:
+        cached = SCRAPE_CACHE.get(max_pages)
+    
+    if cached is not None:
+        logger.info(f"Using cached scrape result for max_pages={max_pages}")
+    else:
+        cached = scrape_and_export(max_pages)
+        with SCRAPE_CACHE_LOCK:
+            SCRAPE_CACHE[max_pages] = cached
+    
+    result, excel_bytes = cached
+    # Callers add fields to the result, so never hand out the cached dict
+    return (dict(result) if result else None), excel_bytes
+
+def scrape_and_export(max_pages):
+    """
+    Scrape tenders and build the Excel export.
+    
+    Args:
+        max_pages: Maximum number of listing pages to scrape
+    
+    Returns:
+        A (result, excel_bytes) tuple, where result holds the response tenders,
+        the Excel file name and its download URL. Both are None when no new
+        tenders were found.
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    excel_filename = f'tenders_{timestamp}.xlsx'
+    
+    # Write to Excel in memory straight from the tender dicts - the data is
+    # only ever serialised, so there is no need for a DataFrame copy.
+    # constant_memory flushes each row as soon as the next one starts.
+    bio = BytesIO()
+    workbook = xlsxwriter.Workbook(bio, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Tenders')
+    worksheet.write_row(0, 0, ALL_COLUMNS)
+    
+    # Write each tender as soon as it is scraped and keep only the first 50
+    # (essential columns only) for the response, so the full result set is
+    # never held in memory
+    response_data = []
+    row_num = 0
+    # Create scraper with memory optimizations; leaving the block closes its session
+    with TenderScraper(max_pages=max_pages) as scraper:
+        for row_num, t in enumerate(scraper.iter_tenders(), 1):
+            if len(response_data) < 50:
+                response_data.append(dict(zip(ESSENTIAL_COLUMNS, ESSENTIAL_COLUMNS_GETTER(t))))
+            worksheet.write_row(row_num, 0, ALL_COLUMNS_GETTER(t))
+    workbook.close()
+    
+    if not row_num:
+        logger.info("No new tenders found")
+        return None, None
+    
+    logger.info(f"Found {row_num} tenders")
+    
+    # Keep the workbook for download as raw xlsx bytes
+    download_name = f'tenders_{timestamp}_{uuid.uuid4().hex[:8]}.xlsx'
+    store_download(bio.getvalue(), download_name)
+    
+    result = {
+        'tenders': response_data,
+        'excelFileName': excel_filename,
+        'downloadUrl': f'/api/download/{download_name}'
+    }
+    return result, bio.getvalue()
+
+@bp.route('/api/scrape-tenders', methods=['POST'])
+def scrape_tenders():
+    """Endpoint to scrape tender data with memory optimization."""
+    try:
+        logger.info("Starting tender scraping operation")
+        
+        # Get parameters from request (you could add pagination, etc.)
+        max_pages = request.json.get('max_pages', 3)  # Default to 3 pages to limit memory
+        # Clients that use downloadUrl can skip the inline base64 copy of the workbook
+        inline_excel = request.json.get('inline_excel', True)
+        # The preview duplicates rows already in the workbook; clients that read
+        # the workbook themselves can leave it out
+        include_tenders = request.json.get('include_tenders', True)
+        
+        result, excel_bytes = run_scrape(max_pages)
+        
+        if result:
+            if inline_excel and len(excel_bytes) > INLINE_EXCEL_MAX_BYTES:
+                logger.info("Workbook too large to return inline, only returning downloadUrl")
+                inline_excel = False
+            
+            # The workbook identifies the result; clients re-posting within the
+            # cache window with a matching If-None-Match get a 304
+            etag = hashlib.sha256(excel_bytes).hexdigest()
+            # Different representations of the same result
+            if not inline_excel:
+                etag += '-noinline'
+            if not include_tenders:
+                etag += '-notenders'
+            if etag_matches(etag):
+                return '', 304
+            
+            if not include_tenders:
+                del result['tenders']
+            
+            # Return the Excel as base64
+            if inline_excel:
+                result['excelData'] = pybase64.b64encode(excel_bytes).decode('ascii')
+            
+            response = jsonify(result)
+            response.set_etag(etag)
+            return response
+        else:
+            return jsonify({
+                'tenders': [],
+                'message': 'No new tenders found'
+            }), 404
+    
+    except Exception as e:
+        logger.error(f"Error in scrape_tenders: {str(e)}")
+        logger.error(traceback.format_exc())
+        return jsonify({
+            'error': str(e)
+        }), 500
+
+@bp.route('/api/download/<filename>', methods=['GET'])
+def download_file(filename):
+    """Serve a workbook produced by a previous scrape as a binary download."""
+    try:
+        return send_from_directory(DOWNLOAD_DIR, filename, as_attachment=True,
+                                   mimetype=XLSX_MIMETYPE)
+    except NotFound:
+        return jsonify({
+            'error': 'File not found'
+        }), 404